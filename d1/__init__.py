@@ -1,8 +1,32 @@
 """Desktop pet application package."""
 
-from .agent import PetAgent
-from .app import run_app
-from .models import ChatModelSettings
-from .ui import DesktopPetWindow
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from .agents import PetAgent
+    from .app import run_app
+    from .models import ChatModelSettings
+    from .ui import DesktopPetWindow
+
+# Exports resolve on first access (PEP 562) so importing d1 does not drag in LangChain or Qt.
+_LAZY_EXPORTS: Final[dict[str, str]] = {
+    "ChatModelSettings": ".models",
+    "DesktopPetWindow": ".ui",
+    "PetAgent": ".agents",
+    "run_app": ".app",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = ["ChatModelSettings", "DesktopPetWindow", "PetAgent", "run_app"]
@@ -1,6 +1,7 @@
 """Agent exports."""
 
+from .history import SummarizingHistory
 from .pet_agent import PetAgent
 
-__all__ = ["PetAgent"]
+__all__ = ["PetAgent", "SummarizingHistory"]
 
@@ -0,0 +1,62 @@
+"""Bounded chat history that folds older turns into a heuristic summary."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Final, override
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+_CHARS_PER_TOKEN: Final[int] = 4
+_SUMMARY_HEADER: Final[str] = "Earlier in this conversation:"
+_BULLET_CHARS: Final[int] = 160
+
+
+@dataclass(slots=True, kw_only=True)
+class SummarizingHistory(BaseChatMessageHistory):
+    """Keeps the last few messages verbatim and collapses the rest into one system note."""
+
+    context_window: int = 4096
+    keep_last: int = 6
+    max_summary_lines: int = 12
+    messages: list[BaseMessage] = field(default_factory=list)
+
+    @override
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        self.messages.extend(messages)
+        if self._estimated_tokens() > 0.8 * self.context_window:
+            self.compact()
+
+    @override
+    def clear(self) -> None:
+        self.messages = []
+
+    def _estimated_tokens(self) -> int:
+        return sum(len(message.text) // _CHARS_PER_TOKEN for message in self.messages)
+
+    def compact(self, keep_last: int | None = None) -> None:
+        """Fold all but the last ``keep_last`` messages (default: ``self.keep_last``) into the summary."""
+        cutoff = len(self.messages) - (self.keep_last if keep_last is None else keep_last)
+        if cutoff <= 0:
+            return
+        lines: list[str] = []
+        for message in self.messages[:cutoff]:
+            if _is_summary(message):
+                lines.extend(message.text.splitlines()[1:])
+                continue
+            speaker = "User" if isinstance(message, HumanMessage) else "Pixel"
+            text = " ".join(message.text.split())
+            if len(text) > _BULLET_CHARS:
+                text = f"{text[: _BULLET_CHARS - 1]}…"
+            lines.append(f"- {speaker}: {text}")
+        summary = "\n".join([_SUMMARY_HEADER, *lines[-self.max_summary_lines :]])
+        self.messages[:cutoff] = [SystemMessage(content=summary)]
+
+
+def _is_summary(message: BaseMessage) -> bool:
+    return isinstance(message, SystemMessage) and message.text.startswith(_SUMMARY_HEADER)
+
+
+__all__ = ["SummarizingHistory"]
@@ -2,19 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Self
 
-from langchain_community.chat_message_histories import ChatMessageHistory
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.runnables import Runnable, RunnablePassthrough
+from langchain_core.runnables import Runnable, RunnableLambda, RunnablePassthrough
 
-from ..models import ChatModelSettings, LocalPetChatModel, create_chat_model
-from ..prompts import SYSTEM_PROMPT
+from ..models import ChatModelSettings, LocalPetChatModel, UpstreamSchemaError, create_chat_model
+from ..prompts import SYSTEM_MESSAGE
+from .history import SummarizingHistory
 
 type ChainInput = dict[str, str]
 type HistoryFactory = Callable[[], BaseChatMessageHistory]
@@ -22,62 +24,149 @@ type HistoryFactory = Callable[[], BaseChatMessageHistory]
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _build_prompt() -> ChatPromptTemplate:
+    # The template only depends on SYSTEM_MESSAGE, so every agent can share one parsed instance.
+    return ChatPromptTemplate.from_messages(
+        [
+            SYSTEM_MESSAGE,
+            MessagesPlaceholder(variable_name="chat_history"),
+            ("human", "{user_input}"),
+        ]
+    )
+
+
+def _get_history(_: ChainInput, *, agent: PetAgent) -> list[BaseMessage]:
+    """Read the agent's replay window at invoke time; the agent is a live reference, not a snapshot."""
+    return agent._chat_history.messages[agent._window_start :]
+
+
 @dataclass(slots=True, kw_only=True)
 class PetAgent:
     """Wraps a LangChain conversation chain for the pet."""
 
     config: ChatModelSettings = field(default_factory=ChatModelSettings)
     llm: BaseChatModel | None = None
-    history_factory: HistoryFactory = ChatMessageHistory
+    history_factory: HistoryFactory = SummarizingHistory
+    window_reset_threshold: int = 20
+    _window_start: int = field(init=False, default=0, repr=False)
     _chat_history: BaseChatMessageHistory = field(init=False, repr=False)
     _prompt: ChatPromptTemplate = field(init=False, repr=False)
-    _chain: Runnable[ChainInput, str] = field(init=False, repr=False)
+    _history_step: RunnableLambda[ChainInput, list[BaseMessage]] = field(init=False, repr=False)
+    _chain: Runnable[ChainInput, BaseMessage] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         llm = self.llm or create_chat_model(self.config)
         self._chat_history = self.history_factory()
-        self._prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", SYSTEM_PROMPT),
-                MessagesPlaceholder(variable_name="chat_history"),
-                ("human", "{user_input}"),
-            ]
-        )
+        self._prompt = _build_prompt()
+        self._history_step = RunnableLambda(functools.partial(_get_history, agent=self))
         self._configure_chain(llm)
 
     def _configure_chain(self, llm: BaseChatModel) -> None:
         self.llm = llm
-        self._chain = (
-            RunnablePassthrough.assign(chat_history=lambda _: self._chat_history.messages) | self._prompt | self.llm
-        )
+        self._chain = RunnablePassthrough.assign(chat_history=self._history_step) | self._prompt | self.llm
+
+    def _advance_window(self, previous_total: int) -> None:
+        # Keep the replayed history append-only between resets so provider prompt caches stay warm,
+        # then roll the window forward in one jump instead of sliding it every turn.
+        total = len(self._chat_history.messages)
+        if total < previous_total + 2:
+            # The history compacted itself, so the old window offset no longer lines up.
+            self._window_start = 0
+            return
+        if total - self._window_start <= self.window_reset_threshold:
+            return
+        keep = (self.window_reset_threshold // 2) & ~1
+        if isinstance(self._chat_history, SummarizingHistory):
+            # Fold the span leaving the window into the summary rather than silently dropping it.
+            self._chat_history.compact(keep_last=keep)
+            self._window_start = 0
+            return
+        self._window_start = total - keep
 
     def _switch_to_local_fallback(self) -> None:
         logger.warning("Remote chat model failed; switching to local fallback.")
         self._configure_chain(LocalPetChatModel())
 
     def _needs_local_fallback(self, exc: Exception) -> bool:
-        return isinstance(exc, AttributeError) and "model_dump" in str(exc)
+        return isinstance(exc, UpstreamSchemaError)
 
     def respond(self, user_input: str) -> str:
         """Return the agent's reply for user_input."""
-        self._chat_history.add_user_message(user_input)
         try:
-            result = self._chain.invoke({"user_input": user_input})
+            result = self._invoke_direct(user_input)
+        except Exception as exc:
+            if not self._needs_local_fallback(exc):
+                raise
+            logger.exception("Falling back to local chat model due to upstream failure.")
+            self._switch_to_local_fallback()
+            result = self._invoke_direct(user_input)
+        return self._record_turn(user_input, result.text)
+
+    def _invoke_direct(self, user_input: str) -> BaseMessage:
+        # Same steps as self._chain, minus the RunnableSequence dispatch on the blocking hot path.
+        inputs: ChainInput = {"user_input": user_input}
+        prompt_value = self._prompt.invoke({**inputs, "chat_history": _get_history(inputs, agent=self)})
+        return self.llm.invoke(prompt_value)
+
+    async def arespond(self, user_input: str) -> str:
+        """Async variant of respond() so callers can overlap network latency."""
+        try:
+            result = await self._chain.ainvoke({"user_input": user_input})
         except Exception as exc:
-            if self._needs_local_fallback(exc):
-                logger.exception("Falling back to local chat model due to upstream failure.")
-                self._switch_to_local_fallback()
-                result = self._chain.invoke({"user_input": user_input})
-            else:
+            if not self._needs_local_fallback(exc):
                 raise
-        content = getattr(result, "content", result)
-        reply = content if isinstance(content, str) else str(content)
+            logger.exception("Falling back to local chat model due to upstream failure.")
+            self._switch_to_local_fallback()
+            result = await self._chain.ainvoke({"user_input": user_input})
+        return self._record_turn(user_input, result.text)
+
+    def stream_respond(self, user_input: str) -> Iterator[str]:
+        """Yield reply text as it is generated, recording the turn once the stream completes."""
+        parts: list[str] = []
+        try:
+            for chunk in self._chain.stream({"user_input": user_input}):
+                parts.append(chunk.text)
+                yield chunk.text
+        except Exception as exc:
+            if parts or not self._needs_local_fallback(exc):
+                raise
+            logger.exception("Falling back to local chat model due to upstream failure.")
+            self._switch_to_local_fallback()
+            for chunk in self._chain.stream({"user_input": user_input}):
+                parts.append(chunk.text)
+                yield chunk.text
+        self._record_turn(user_input, "".join(parts))
+
+    async def astream_respond(self, user_input: str) -> AsyncIterator[str]:
+        """Async variant of stream_respond()."""
+        parts: list[str] = []
+        try:
+            async for chunk in self._chain.astream({"user_input": user_input}):
+                parts.append(chunk.text)
+                yield chunk.text
+        except Exception as exc:
+            if parts or not self._needs_local_fallback(exc):
+                raise
+            logger.exception("Falling back to local chat model due to upstream failure.")
+            self._switch_to_local_fallback()
+            async for chunk in self._chain.astream({"user_input": user_input}):
+                parts.append(chunk.text)
+                yield chunk.text
+        self._record_turn(user_input, "".join(parts))
+
+    def _record_turn(self, user_input: str, reply: str) -> str:
+        # History is only extended once the call succeeded so retries replay an identical prefix.
+        previous_total = len(self._chat_history.messages)
+        self._chat_history.add_user_message(user_input)
         self._chat_history.add_ai_message(reply)
+        self._advance_window(previous_total)
         return reply.strip()
 
     def reset(self) -> Self:
         """Clear the running conversation and allow chaining."""
         self._chat_history.clear()
+        self._window_start = 0
         return self
 
 
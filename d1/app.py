@@ -2,14 +2,41 @@
 
 from __future__ import annotations
 
+import functools
 import sys
+from dataclasses import dataclass
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
+from .agents import PetAgent
+from .models import ChatModelSettings, create_chat_model
 from .ui import DesktopPetWindow, DuckOverlayWindow
 
 
-def run_app(*, window: DesktopPetWindow | None = None) -> None:
+@dataclass(slots=True, frozen=True)
+class _AppRefs:
+    """Top-level windows pinned for the lifetime of the running app."""
+
+    overlay: DuckOverlayWindow
+    chat: DesktopPetWindow
+
+
+_app_refs: _AppRefs | None = None
+
+
+@functools.cache
+def _shared_agent(settings: ChatModelSettings) -> PetAgent:
+    return PetAgent(config=settings)
+
+
+def reset_caches() -> None:
+    """Drop cached agents and chat models, e.g. between tests that need isolation."""
+    _shared_agent.cache_clear()
+    create_chat_model.cache_clear()
+
+
+def run_app(*, window: DesktopPetWindow | None = None, settings: ChatModelSettings | None = None) -> None:
     """Entrypoint used by main.py."""
     app = QApplication.instance()
     owns_app = False
@@ -17,17 +44,30 @@ def run_app(*, window: DesktopPetWindow | None = None) -> None:
         app = QApplication(sys.argv)
         owns_app = True
 
-    chat_window = window or DesktopPetWindow()
+    settings = settings or ChatModelSettings()
+    chat_window = window or DesktopPetWindow(agent=_shared_agent(settings))
     chat_window.hide()
 
-    duck_overlay = DuckOverlayWindow()
+    duck_overlay = DuckOverlayWindow(agent=PetAgent(config=settings))
 
+    def _handle_duck_click() -> None:
+        if chat_window.isVisible():
+            return
+        chat_window.show()
+        chat_window.raise_()
+        chat_window.activateWindow()
+
+    # Both objects live on the GUI thread, so call the slot directly instead of posting an event.
+    duck_overlay.duck_clicked.connect(_handle_duck_click, Qt.ConnectionType.DirectConnection)
     duck_overlay.destroyed.connect(chat_window.close)
     duck_overlay.show()
 
     # Keep references alive for the duration of the app.
-    setattr(app, "_duck_overlay", duck_overlay)
-    setattr(app, "_chat_window", chat_window)
+    global _app_refs
+    _app_refs = _AppRefs(overlay=duck_overlay, chat=chat_window)
 
     if owns_app:
         sys.exit(app.exec())
+
+
+__all__ = ["reset_caches", "run_app"]
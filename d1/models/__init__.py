@@ -1,7 +1,22 @@
 """Chat model helpers for the desktop pet."""
 
-from .factory import ChatModelSettings, create_chat_model
-from .local import LocalPetChatModel
+from __future__ import annotations
 
-__all__ = ["ChatModelSettings", "LocalPetChatModel", "create_chat_model"]
+from typing import TYPE_CHECKING, Any
 
+from .factory import ChatModelSettings, UpstreamSchemaError, create_chat_model
+
+if TYPE_CHECKING:
+    from .local import LocalPetChatModel
+
+
+def __getattr__(name: str) -> Any:
+    # LocalPetChatModel subclasses a LangChain base class; only import it when asked for.
+    if name != "LocalPetChatModel":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .local import LocalPetChatModel
+
+    return LocalPetChatModel
+
+
+__all__ = ["ChatModelSettings", "LocalPetChatModel", "UpstreamSchemaError", "create_chat_model"]
@@ -2,28 +2,27 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import sys
 from dataclasses import dataclass
 from os import getenv
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
-from langchain_core.language_models.chat_models import BaseChatModel
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
-from .local import LocalPetChatModel
-
-load_dotenv()
-
-try:
-    from langchain_openai import ChatOpenAI
-except Exception:  # pragma: no cover - optional dependency
-    ChatOpenAI = None  # type: ignore[assignment]
+    from langchain_core.language_models.chat_models import BaseChatModel
 
 logger = logging.getLogger(__name__)
 _PY314_OR_NEWER = sys.version_info >= (3, 14)
 _warned_py314: bool = False
 
 
+class UpstreamSchemaError(RuntimeError):
+    """Raised when the remote chat backend returns a payload the OpenAI client cannot parse."""
+
+
 @dataclass(slots=True, frozen=True)
 class ChatModelSettings:
     """Declarative config for the preferred chat model."""
@@ -48,9 +47,25 @@ def _runtime_supports_remote() -> bool:
     return False
 
 
+@functools.cache
+def _load_grok_backend() -> Callable[..., BaseChatModel] | None:
+    """Load .env and import the ChatOpenAI adapter once, on the first remote model request."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    try:
+        from .grok import build_grok_model
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return build_grok_model
+
+
 def _build_grok_model(settings: ChatModelSettings) -> BaseChatModel | None:
     """Return a ChatOpenAI client pointed at the Grok deployment."""
-    if ChatOpenAI is None or not _runtime_supports_remote():
+    if not _runtime_supports_remote():
+        return None
+    build_grok_model = _load_grok_backend()
+    if build_grok_model is None:
         return None
 
     base_url = settings.base_url or getenv("GROK_BASE_URL")
@@ -58,7 +73,7 @@ def _build_grok_model(settings: ChatModelSettings) -> BaseChatModel | None:
     if not base_url or not api_key:
         return None
 
-    return ChatOpenAI(
+    return build_grok_model(
         model=settings.model_name,
         temperature=settings.temperature,
         base_url=base_url.rstrip("/"),
@@ -67,12 +82,19 @@ def _build_grok_model(settings: ChatModelSettings) -> BaseChatModel | None:
     )
 
 
+@functools.cache
 def create_chat_model(settings: ChatModelSettings) -> BaseChatModel:
-    """Return the Grok LLM when possible, otherwise a local fallback."""
+    """Return the Grok LLM when possible, otherwise a local fallback.
+
+    Models are cached per settings so agents share one HTTP client and its warm connections.
+    """
     grok_model = _build_grok_model(settings)
     if grok_model is not None:
         return grok_model
+
+    from .local import LocalPetChatModel
+
     return LocalPetChatModel()
 
 
-__all__ = ["ChatModelSettings", "create_chat_model"]
+__all__ = ["ChatModelSettings", "UpstreamSchemaError", "create_chat_model"]
@@ -0,0 +1,78 @@
+"""ChatOpenAI adapter for Grok deployments."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextlib
+import functools
+from collections.abc import AsyncIterator, Iterator
+from typing import Any, override
+
+import httpx
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI
+
+from .factory import UpstreamSchemaError
+
+
+@contextlib.contextmanager
+def _schema_guard() -> Iterator[None]:
+    try:
+        yield
+    except AttributeError as exc:
+        # Gateways that answer with bare strings instead of OpenAI objects surface as a missing model_dump.
+        if "model_dump" not in str(exc):
+            raise
+        raise UpstreamSchemaError(str(exc)) from exc
+
+
+class GrokChatModel(ChatOpenAI):
+    """ChatOpenAI that reports malformed gateway payloads as UpstreamSchemaError."""
+
+    @override
+    def _generate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        with _schema_guard():
+            return super()._generate(*args, **kwargs)
+
+    @override
+    async def _agenerate(self, *args: Any, **kwargs: Any) -> ChatResult:
+        with _schema_guard():
+            return await super()._agenerate(*args, **kwargs)
+
+    @override
+    def _stream(self, *args: Any, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        with _schema_guard():
+            yield from super()._stream(*args, **kwargs)
+
+    @override
+    async def _astream(self, *args: Any, **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        with _schema_guard():
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+
+
+@functools.cache
+def _shared_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Process-wide HTTP/2 pools so every Grok model multiplexes over the same warm connections."""
+    limits = httpx.Limits(max_keepalive_connections=8)
+    client = httpx.Client(http2=True, limits=limits)
+    async_client = httpx.AsyncClient(http2=True, limits=limits)
+    atexit.register(_close_http_clients, client, async_client)
+    return client, async_client
+
+
+def _close_http_clients(client: httpx.Client, async_client: httpx.AsyncClient) -> None:
+    client.close()
+    # Connections may belong to an event loop that is already gone; the process is exiting either way.
+    with contextlib.suppress(Exception):
+        asyncio.run(async_client.aclose())
+
+
+def build_grok_model(**kwargs: Any) -> GrokChatModel:
+    """Return a GrokChatModel wired to the shared HTTP/2 connection pools."""
+    client, async_client = _shared_http_clients()
+    return GrokChatModel(http_client=client, http_async_client=async_client, **kwargs)
+
+
+__all__ = ["GrokChatModel", "build_grok_model"]
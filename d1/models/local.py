@@ -2,16 +2,45 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Sequence
 from random import choice
-from typing import override
+from typing import Any, Final, override
 
+from langchain_core.language_models import LanguageModelInput
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableConfig, ensure_config
 
 type ChatMessages = Sequence[BaseMessage]
 
+_WORD_PATTERN: Final = re.compile(r"\w+")
+# Checked in order; the first rule sharing a word with the user text wins.
+_RULES: Final[tuple[tuple[frozenset[str], str], ...]] = (
+    (
+        frozenset({"joke", "jokes"}),
+        "Pixel wiggles whiskers: Why did the cat sit on the computer? To keep an eye on the mouse! :3",
+    ),
+    (
+        frozenset({"tired", "break"}),
+        "Nap buddies? Pixel suggests a big stretch and a sip of water before continuing. *purr*",
+    ),
+    (
+        frozenset({"hello", "hi"}),
+        "Hii! Pixel does a flip in the air and waves paws excitedly!",
+    ),
+)
+# Keyword -> index of the first rule listing it, so matching is one dict probe per word.
+_KEYWORD_RULES: Final[dict[str, int]] = {
+    keyword: index for index, (keywords, _) in reversed(list(enumerate(_RULES))) for keyword in keywords
+}
+_TEMPLATES: Final[tuple[str, ...]] = (
+    "Pixel paws at the screen: {cue} *chirp*",
+    "Pixel tilts head: {cue} nya~",
+    "Pixel fluffs tail: {cue} purrr!",
+)
+
 
 class LocalPetChatModel(BaseChatModel):
     """Deterministic, friendly responses without relying on remote APIs."""
@@ -38,26 +67,72 @@ class LocalPetChatModel(BaseChatModel):
         generation = ChatGeneration(message=AIMessage(content=reply))
         return ChatResult(generations=[generation])
 
+    @override
+    async def _agenerate(  # pragma: no cover - langchain hook
+        self,
+        messages: ChatMessages,
+        stop: Sequence[str] | None = None,
+        run_manager=None,
+        **kwargs,
+    ) -> ChatResult:
+        # Replies are computed in-process, so skip the default thread-pool hop.
+        return self._generate(messages, stop=stop, **kwargs)
+
+    @override
+    def batch(
+        self,
+        inputs: list[LanguageModelInput],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[AIMessage]:
+        # Replies are computed in-process, so one generate() loop beats LangChain's thread-per-input fan-out.
+        if isinstance(config, list) or return_exceptions:
+            return super().batch(inputs, config, return_exceptions=return_exceptions, **kwargs)
+        config = ensure_config(config)
+        result = self.generate_prompt(
+            [self._convert_input(item) for item in inputs],
+            callbacks=config.get("callbacks"),
+            tags=config.get("tags"),
+            metadata=config.get("metadata"),
+            run_name=config.get("run_name"),
+            **kwargs,
+        )
+        return [generations[0].message for generations in result.generations]
+
+    @override
+    async def abatch(
+        self,
+        inputs: list[LanguageModelInput],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[AIMessage]:
+        if isinstance(config, list) or return_exceptions:
+            return await super().abatch(inputs, config, return_exceptions=return_exceptions, **kwargs)
+        config = ensure_config(config)
+        result = await self.agenerate_prompt(
+            [self._convert_input(item) for item in inputs],
+            callbacks=config.get("callbacks"),
+            tags=config.get("tags"),
+            metadata=config.get("metadata"),
+            run_name=config.get("run_name"),
+            **kwargs,
+        )
+        return [generations[0].message for generations in result.generations]
+
     def _craft_reply(self, user_text: str) -> str:
         if not user_text:
             return "Pixel is here and ready to play! Meow!"
 
-        lowered = user_text.casefold()
-        match lowered:
-            case text if "joke" in text:
-                return "Pixel wiggles whiskers: Why did the cat sit on the computer? To keep an eye on the mouse! :3"
-            case text if any(keyword in text for keyword in ("tired", "break")):
-                return "Nap buddies? Pixel suggests a big stretch and a sip of water before continuing. *purr*"
-            case text if any(greeting in text for greeting in ("hello", "hi")):
-                return "Hii! Pixel does a flip in the air and waves paws excitedly!"
-            case _:
-                templates = [
-                    "Pixel paws at the screen: {cue} *chirp*",
-                    "Pixel tilts head: {cue} nya~",
-                    "Pixel fluffs tail: {cue} purrr!",
-                ]
-                cue = f"I heard you mention '{user_text[:40]}'. Let's keep going together!"
-                return choice(templates).format(cue=cue)
+        words = _WORD_PATTERN.findall(user_text.casefold())
+        matched = [_KEYWORD_RULES[word] for word in words if word in _KEYWORD_RULES]
+        if matched:
+            return _RULES[min(matched)][1]
+        cue = f"I heard you mention '{user_text[:40]}'. Let's keep going together!"
+        return choice(_TEMPLATES).format(cue=cue)
 
 
 __all__ = ["LocalPetChatModel"]
@@ -2,6 +2,6 @@
 
 from .duck_overlay import DuckOverlayWindow
 from .window import DesktopPetWindow
-from .worker import AgentWorker
+from .worker import AgentChannel, AgentLoop, AgentRequest
 
-__all__ = ["AgentWorker", "DesktopPetWindow", "DuckOverlayWindow"]
+__all__ = ["AgentChannel", "AgentLoop", "AgentRequest", "DesktopPetWindow", "DuckOverlayWindow"]
@@ -4,17 +4,77 @@ from __future__ import annotations
 
 import contextlib
 import logging
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-
-from PySide6.QtCore import QPoint, QPointF, QRectF, Qt, QThread, QTimer, Signal
-from PySide6.QtGui import QBrush, QColor, QGuiApplication, QMovie, QPainter, QPainterPath, QPen, QPixmap
+from types import MappingProxyType
+from typing import ClassVar, Final, final, override
+
+from PySide6.QtCore import QObject, QPointF, QRect, QRectF, QRunnable, QSize, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import (
+    QAction,
+    QBrush,
+    QColor,
+    QGuiApplication,
+    QImage,
+    QImageReader,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QPolygonF,
+    QScreen,
+)
 from PySide6.QtWidgets import QLabel, QMenu, QVBoxLayout, QWidget
 
 from ..agents import PetAgent
-from .worker import AgentWorker
+from .worker import AgentChannel
 
 logger = logging.getLogger(__name__)
 
+type AnimationFrames = tuple[tuple[QPixmap, int], ...]
+
+
+type DecodedFrames = tuple[tuple[QImage, int], ...]
+
+_MIN_FRAME_DELAY_MS: Final[int] = 20
+_BUBBLE_TEXT_WIDTH: Final[int] = 360
+_BUBBLE_TEXT_HEIGHT_LIMIT: Final[int] = 10**6
+_DEFAULT_MOVE_INTERVAL_MS: Final[int] = 16
+
+# GUI-thread only: QPixmap cannot be created off the main thread, so decoded images are converted on arrival.
+_frame_cache: dict[Path, AnimationFrames] = {}
+
+
+def _read_frames(movie_path: Path) -> DecodedFrames:
+    reader = QImageReader(str(movie_path))
+    frames: list[tuple[QImage, int]] = []
+    while reader.canRead():
+        image = reader.read()
+        if image.isNull():
+            break
+        frames.append((image, max(reader.nextImageDelay(), _MIN_FRAME_DELAY_MS)))
+    return tuple(frames)
+
+
+@final
+class FrameDecodeJob(QRunnable):
+    """Decodes GIF animations into QImages on the shared QThreadPool."""
+
+    @final
+    class Signals(QObject):
+        """Carries ``dict[Path, DecodedFrames]`` back to the GUI thread."""
+
+        decoded = Signal(object)
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        super().__init__()
+        self._paths = tuple(paths)
+        self.signals = FrameDecodeJob.Signals()
+
+    @override
+    def run(self) -> None:
+        self.signals.decoded.emit({path: _read_frames(path) for path in self._paths})
+
 
 class ChatBubbleWidget(QWidget):
     """Floating dialog bubble drawn with QPainter."""
@@ -36,6 +96,7 @@ class ChatBubbleWidget(QWidget):
         self._tail_height = 20
         self._tail_width = 32
         self._tail_offset = 40
+        self._cached_image: QImage | None = None
 
         self._label = QLabel(text, self)
         self._label.setWordWrap(True)
@@ -45,42 +106,69 @@ class ChatBubbleWidget(QWidget):
         layout.setContentsMargins(20, 20, 20, 20 + self._tail_height)
         layout.addWidget(self._label)
 
-        self.adjustSize()
+        self._label.ensurePolished()
+        self._metrics = self._label.fontMetrics()
+        margins = layout.contentsMargins()
+        self._padding = QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
+        self._fit_to_text(text)
 
     def setText(self, text: str) -> None:
         self._label.setText(text)
-        self.adjustSize()
-        self.update()
+        self._fit_to_text(text)
+
+    def _fit_to_text(self, text: str) -> None:
+        # Measure the wrapped text directly instead of running adjustSize() through the layout engine.
+        bounds = self._metrics.boundingRect(
+            QRect(0, 0, _BUBBLE_TEXT_WIDTH, _BUBBLE_TEXT_HEIGHT_LIMIT), Qt.TextFlag.TextWordWrap, text
+        )
+        self.resize(bounds.size() + self._padding)
+
+    def resizeEvent(self, event) -> None:  # pragma: no cover - UI hook
+        # The label paints itself; only the background depends on geometry.
+        self._cached_image = None
+        super().resizeEvent(event)
 
     def paintEvent(self, event) -> None:  # pragma: no cover - UI hook
+        if self._cached_image is None:
+            self._cached_image = self._render_bubble()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawImage(0, 0, self._cached_image)
+
+    def _render_bubble(self) -> QImage:
+        """Rasterise the outline once per size; paints afterwards are a plain blit."""
+        ratio = self.devicePixelRatioF()
+        image = QImage(self.size() * ratio, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.GlobalColor.transparent)
+
+        half_border = self._border_width / 2
+        body = QRectF(
+            half_border,
+            half_border,
+            self.width() - self._border_width,
+            self.height() - self._tail_height - self._border_width,
+        )
+        base_left = QPointF(body.left() + self._tail_offset, body.bottom())
+        base_right = QPointF(base_left.x() + self._tail_width, body.bottom())
+        tip = QPointF(base_left.x() - 10, body.bottom() + self._tail_height)
+        seam = QPointF(0, self._border_width)
 
         pen = QPen(QColor("black"))
         pen.setWidth(self._border_width)
+        painter = QPainter(image)
         painter.setPen(pen)
         painter.setBrush(QBrush(QColor("white")))
+        # The body is axis-aligned apart from its corners, so it skips antialiasing; only the slanted tail needs it.
+        painter.drawRoundedRect(body, self._border_radius, self._border_radius)
 
-        rect_x = self._border_width / 2
-        rect_y = self._border_width / 2
-        rect_w = self.width() - self._border_width
-        rect_h = self.height() - self._tail_height - self._border_width
-
-        body_path = QPainterPath()
-        body_path.addRoundedRect(QRectF(rect_x, rect_y, rect_w, rect_h), self._border_radius, self._border_radius)
-
-        tail_path = QPainterPath()
-        tail_start_x = rect_x + self._tail_offset
-        tail_start_y = rect_y + rect_h
-        p1 = QPointF(tail_start_x, tail_start_y)
-        p2 = QPointF(tail_start_x + self._tail_width, tail_start_y)
-        p3 = QPointF(tail_start_x - 10, tail_start_y + self._tail_height)
-        tail_path.moveTo(p1)
-        tail_path.lineTo(p3)
-        tail_path.lineTo(p2)
-        tail_path.closeSubpath()
-
-        painter.drawPath(body_path.united(tail_path))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        # Fill up over the body's bottom stroke so the tail opens into the bubble without a seam.
+        painter.drawPolygon(QPolygonF([base_left - seam, tip, base_right - seam]))
+        painter.setPen(pen)
+        painter.drawPolyline(QPolygonF([base_left, tip, base_right]))
+        painter.end()
+        return image
 
 
 class DuckOverlayWindow(QWidget):
@@ -88,6 +176,41 @@ class DuckOverlayWindow(QWidget):
 
     duck_clicked = Signal()
 
+    _ACTION_PROMPTS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "click": (
+                "A user taps you on their desktop seeking help. Introduce yourself as Nova the Super Duck of the "
+                "Multiverse, offer immediate assistance on anything, and invite them to ask for specifics."
+            ),
+            "chat": (
+                "The user opens a context menu and selects 'Chat'. Greet them warmly as Nova the Super Duck, summarize "
+                "how you can help with life, code, or creativity, and politely ask what they'd like to do next."
+            ),
+            "joke": (
+                "The user selects 'Joke' from a context menu. Reply as Nova the Super Duck with a single playful, "
+                "cosmic-themed joke or pun (keep it under three sentences) and add a cheerful emoji."
+            ),
+            "touch": (
+                "The user gently boops or pats Nova by choosing 'Touch'. React with delight, describe a cute physical "
+                "animation, and invite them to keep interacting."
+            ),
+        }
+    )
+    _ACTION_PREVIEWS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "click": "Nova is tuning in... 🪐",
+            "chat": "Nova leans in to chat...",
+            "joke": "Nova riffling through joke scrolls...",
+            "touch": "Nova fluffs feathers from the boop!",
+        }
+    )
+
+    _MENU_ACTIONS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ("Chat with Nova", "chat"),
+        ("Tell me a joke", "joke"),
+        ("Touch Nova", "touch"),
+    )
+
     def __init__(
         self, *, asset_dir: Path | None = None, parent: QWidget | None = None, agent: PetAgent | None = None
     ) -> None:
@@ -99,6 +222,14 @@ class DuckOverlayWindow(QWidget):
         self._timer = QTimer(self)
         self._timer.setInterval(30)
         self._timer.timeout.connect(self._animate_step)
+        self._bounds_screen: QScreen | None = None
+        self._screen_geometry: QRect | None = None
+        self._screen_bounds: tuple[int, int] | None = None
+        self._move_interval_ms = _DEFAULT_MOVE_INTERVAL_MS
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.primaryScreenChanged.connect(self._bind_screen)
+        self._bind_screen(QGuiApplication.primaryScreen())
 
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, True)
@@ -111,64 +242,52 @@ class DuckOverlayWindow(QWidget):
         )
 
         self._duck_label = QLabel(self)
-        self._duck_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        self._duck_label.setStyleSheet("background: transparent;")
+        # The window is already translucent; skipping the label's own background fill avoids a clear per frame.
+        self._duck_label.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
-        self._movies = {
-            1: self._load_movie("duck-right.gif"),
-            -1: self._load_movie("duck-left.gif"),
+        self._frame_paths = {
+            1: self._asset_path("duck-right.gif"),
+            -1: self._asset_path("duck-left.gif"),
+        }
+        self._frames: dict[int, AnimationFrames] = {
+            direction: _frame_cache[path] for direction, path in self._frame_paths.items() if path in _frame_cache
         }
-        self._current_movie: QMovie | None = None
+        self._decode_signals: FrameDecodeJob.Signals | None = None
+        self._animation: AnimationFrames | None = None
+        self._frame_idx = 0
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._advance_frame)
         self._front_pixmap = self._load_pixmap("duck-frontend.png")
         self._chatbox_label = ChatBubbleWidget("Summoning cosmic quacks...", parent=None)
         self._chatbox_label.hide()
         self._chatbox_timer = QTimer(self)
         self._chatbox_timer.setSingleShot(True)
         self._chatbox_timer.timeout.connect(self._chatbox_label.hide)
+        # One 0 ms trampoline folds every reposition/show request from an event-loop pass into a single sync.
+        self._chatbox_sync_timer = QTimer(self)
+        self._chatbox_sync_timer.setSingleShot(True)
+        self._chatbox_sync_timer.setInterval(0)
+        self._chatbox_sync_timer.timeout.connect(self._sync_chatbox)
+        self._chatbox_show_pending = False
         self.destroyed.connect(self._chatbox_label.close)
-        self._action_prompts = {
-            "click": (
-                "A user taps you on their desktop seeking help. Introduce yourself as Nova the Super Duck of the "
-                "Multiverse, offer immediate assistance on anything, and invite them to ask for specifics."
-            ),
-            "chat": (
-                "The user opens a context menu and selects 'Chat'. Greet them warmly as Nova the Super Duck, summarize "
-                "how you can help with life, code, or creativity, and politely ask what they'd like to do next."
-            ),
-            "joke": (
-                "The user selects 'Joke' from a context menu. Reply as Nova the Super Duck with a single playful, "
-                "cosmic-themed joke or pun (keep it under three sentences) and add a cheerful emoji."
-            ),
-            "touch": (
-                "The user gently boops or pats Nova by choosing 'Touch'. React with delight, describe a cute physical "
-                "animation, and invite them to keep interacting."
-            ),
-        }
-        self._action_previews = {
-            "click": "Nova is tuning in... 🪐",
-            "chat": "Nova leans in to chat...",
-            "joke": "Nova riffling through joke scrolls...",
-            "touch": "Nova fluffs feathers from the boop!",
-        }
-        self._context_menu = QMenu(self)
-        self._chat_action = self._context_menu.addAction("Chat with Nova")
-        self._chat_action.triggered.connect(lambda: self._request_duck_reply("chat"))
-        self._joke_action = self._context_menu.addAction("Tell me a joke")
-        self._joke_action.triggered.connect(lambda: self._request_duck_reply("joke"))
-        self._touch_action = self._context_menu.addAction("Touch Nova")
-        self._touch_action.triggered.connect(lambda: self._request_duck_reply("touch"))
-        self._context_menu.addSeparator()
-        self._exit_action = self._context_menu.addAction("Exit")
-        self._exit_action.triggered.connect(self._handle_exit)
-        self._context_menu.aboutToHide.connect(self._handle_context_menu_closed)
-        self._apply_movie(self._movies[1])
+        self._context_menu: QMenu | None = None
+        self._is_paused = False
+        if len(self._frames) < len(self._frame_paths):
+            self._start_frame_decode()
+        self._apply_animation(1)
         self._is_dragging = False
         self._did_drag = False
-        self._drag_offset = QPointF()
-        self._is_paused = False
-        self._threads: list[QThread] = []
-        self._worker_threads: dict[AgentWorker, QThread] = {}
-        self._is_generating = False
+        self._drag_offset: tuple[int, int] = (0, 0)
+        self._pending_move: tuple[int, int] | None = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.timeout.connect(self._flush_pending_move)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._channel = AgentChannel(self._agent)
+        self._channel.responded.connect(self._handle_agent_reply, queued)
+        self._channel.errored.connect(self._handle_agent_error, queued)
+        self.destroyed.connect(self._channel.close)
         self._menu_forced_pause = False
 
     def showEvent(self, event) -> None:  # pragma: no cover - UI hook
@@ -176,12 +295,16 @@ class DuckOverlayWindow(QWidget):
         self._place_initial()
         if not self._timer.isActive():
             self._timer.start()
+        if self._animation is not None and not self._frame_timer.isActive():
+            self._frame_timer.start(self._animation[self._frame_idx][1])
 
     def moveEvent(self, event) -> None:  # pragma: no cover - UI hook
         super().moveEvent(event)
         self._update_chatbox_position()
 
     def hideEvent(self, event) -> None:  # pragma: no cover - UI hook
+        self._chatbox_sync_timer.stop()
+        self._chatbox_show_pending = False
         self._chatbox_label.hide()
         super().hideEvent(event)
 
@@ -189,19 +312,23 @@ class DuckOverlayWindow(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             self._is_dragging = True
             self._did_drag = False
-            self._drag_offset = event.position()
+            press_pos = event.position().toPoint()
+            self._drag_offset = (press_pos.x(), press_pos.y())
             if not self._is_paused and self._timer.isActive():
                 self._timer.stop()
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event) -> None:  # pragma: no cover - UI hook
         if self._is_dragging and (event.buttons() & Qt.MouseButton.LeftButton):
+            # Plain int math: high polling-rate mice deliver these far more often than the screen refreshes.
+            offset_x, offset_y = self._drag_offset
             global_pos = event.globalPosition()
-            target_pos = global_pos - self._drag_offset
-            self.move(int(target_pos.x()), int(target_pos.y()))
+            self._pending_move = (int(global_pos.x()) - offset_x, int(global_pos.y()) - offset_y)
+            if not self._move_timer.isActive():
+                self._move_timer.start(self._move_interval_ms)
             if not self._did_drag:
-                delta = event.position() - self._drag_offset
-                if delta.manhattanLength() >= 1:
+                local_pos = event.position()
+                if abs(int(local_pos.x()) - offset_x) + abs(int(local_pos.y()) - offset_y) >= 1:
                     self._did_drag = True
             event.accept()
             return
@@ -211,6 +338,7 @@ class DuckOverlayWindow(QWidget):
         if event.button() == Qt.MouseButton.LeftButton and self._is_dragging:
             was_drag = self._did_drag
             self._is_dragging = False
+            self._flush_pending_move()
             self._did_drag = False
             if was_drag:
                 if not self._is_paused and not self._timer.isActive():
@@ -226,33 +354,91 @@ class DuckOverlayWindow(QWidget):
     def contextMenuEvent(self, event) -> None:  # pragma: no cover - UI hook
         self._menu_forced_pause = not self._is_paused
         self._set_paused(True)
-        self._context_menu.popup(event.globalPos())
+        self._ensure_context_menu().popup(event.globalPos())
         event.accept()
 
-    def _load_movie(self, filename: str) -> QMovie:
-        movie_path = (self._asset_dir / filename).resolve()
-        movie = QMovie(str(movie_path))
-        movie.setCacheMode(QMovie.CacheMode.CacheAll)
-        return movie
-
-    def _apply_movie(self, movie: QMovie) -> None:
-        if self._current_movie and self._current_movie is not movie:
-            self._current_movie.stop()
-        self._current_movie = movie
-        self._duck_label.setMovie(movie)
-        movie.jumpToFrame(0)
-        frame_size = movie.frameRect().size()
+    def _ensure_context_menu(self) -> QMenu:
+        # Most sessions never right-click, so the menu is only built on first use.
+        if self._context_menu is None:
+            menu = QMenu(self)
+            for label, action in self._MENU_ACTIONS:
+                menu.addAction(label).setData(action)
+            menu.addSeparator()
+            menu.addAction("Exit").triggered.connect(self._handle_exit)
+            menu.triggered.connect(self._handle_menu_action)
+            menu.aboutToHide.connect(self._handle_context_menu_closed)
+            self._context_menu = menu
+        return self._context_menu
+
+    def _handle_menu_action(self, menu_action: QAction) -> None:
+        action = menu_action.data()
+        if action:
+            self._request_duck_reply(action)
+
+    def _flush_pending_move(self) -> None:
+        # Drag events can arrive far faster than the display refreshes; only the latest target matters.
+        self._move_timer.stop()
+        if self._pending_move is None:
+            return
+        (target_x, target_y), self._pending_move = self._pending_move, None
+        self.move(target_x, target_y)
+
+    def _asset_path(self, filename: str) -> Path:
+        path = (self._asset_dir / filename).resolve()
+        if not path.is_file():
+            raise FileNotFoundError(f"Missing duck animation asset: {path}")
+        return path
+
+    def _start_frame_decode(self) -> None:
+        # Decoding both GIFs is the slowest part of construction; the front pose stands in until it finishes.
+        job = FrameDecodeJob(self._frame_paths.values())
+        job.signals.decoded.connect(self._handle_frames_decoded, Qt.ConnectionType.QueuedConnection)
+        self._decode_signals = job.signals
+        QThreadPool.globalInstance().start(job)
+
+    def _handle_frames_decoded(self, decoded: dict[Path, DecodedFrames]) -> None:
+        self._decode_signals = None
+        for path, images in decoded.items():
+            if not images:
+                logger.error("Could not decode duck animation: %s", path)
+                continue
+            _frame_cache.setdefault(path, tuple((QPixmap.fromImage(image), delay) for image, delay in images))
+        self._frames = {
+            direction: _frame_cache[path] for direction, path in self._frame_paths.items() if path in _frame_cache
+        }
+        if not self._is_paused:
+            self._apply_animation(self._direction)
+
+    def _apply_animation(self, direction: int) -> None:
+        animation = self._frames.get(direction)
+        if animation is None:
+            self._apply_pixmap(self._front_pixmap)
+            return
+        self._animation = animation
+        self._frame_idx = 0
+        pixmap, delay = self._animation[0]
+        self._set_label_opaque(pixmap)
+        self._duck_label.setPixmap(pixmap)
+        frame_size = pixmap.size()
         if frame_size.isValid():
             self.resize(frame_size)
             self._duck_label.resize(frame_size)
-        movie.start()
+        self._frame_timer.start(delay)
         self._update_chatbox_position()
 
+    def _advance_frame(self) -> None:
+        # Let the chain lapse while hidden; showEvent restarts it.
+        if self._animation is None or not self.isVisible():
+            return
+        self._frame_idx = (self._frame_idx + 1) % len(self._animation)
+        pixmap, delay = self._animation[self._frame_idx]
+        self._duck_label.setPixmap(pixmap)
+        self._frame_timer.start(delay)
+
     def _apply_pixmap(self, pixmap: QPixmap) -> None:
-        if self._current_movie:
-            self._current_movie.stop()
-            self._current_movie = None
-        self._duck_label.clear()
+        self._frame_timer.stop()
+        self._animation = None
+        self._set_label_opaque(pixmap)
         self._duck_label.setPixmap(pixmap)
         size = pixmap.size()
         if size.isValid():
@@ -260,42 +446,74 @@ class DuckOverlayWindow(QWidget):
             self._duck_label.resize(size)
         self._update_chatbox_position()
 
+    def _set_label_opaque(self, pixmap: QPixmap) -> None:
+        # Only frames without alpha cover every pixel, letting Qt skip erasing the label before painting.
+        self._duck_label.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, not pixmap.hasAlphaChannel())
+
     def _load_pixmap(self, filename: str) -> QPixmap:
-        pixmap_path = (self._asset_dir / filename).resolve()
-        pixmap = QPixmap(str(pixmap_path))
+        key = str((self._asset_dir / filename).resolve())
+        cached = QPixmapCache.find(key)
+        if cached is not None:
+            return cached
+        pixmap = QPixmap(key)
         if pixmap.isNull():
-            raise FileNotFoundError(f"Missing duck pixmap asset: {pixmap_path}")
+            raise FileNotFoundError(f"Missing duck pixmap asset: {key}")
+        QPixmapCache.insert(key, pixmap)
         return pixmap
 
     def _place_initial(self) -> None:
-        screen = QGuiApplication.primaryScreen()
-        if screen is None:
+        geom = self._screen_geometry
+        if geom is None:
             return
-        geom = screen.availableGeometry()
         target_y = geom.bottom() - self.height() - 80
         target_x = geom.left() + (geom.width() // 2)
-        self.move(QPoint(target_x, target_y))
+        self.move(target_x, target_y)
+
+    def _bind_screen(self, screen: QScreen | None) -> None:
+        if self._bounds_screen is not None:
+            with contextlib.suppress(RuntimeError, TypeError):
+                self._bounds_screen.availableGeometryChanged.disconnect(self._refresh_bounds)
+            with contextlib.suppress(RuntimeError, TypeError):
+                self._bounds_screen.refreshRateChanged.disconnect(self._refresh_bounds)
+        self._bounds_screen = screen
+        if screen is not None:
+            screen.availableGeometryChanged.connect(self._refresh_bounds)
+            screen.refreshRateChanged.connect(self._refresh_bounds)
+        self._refresh_bounds()
+
+    def _refresh_bounds(self) -> None:
+        # Cached so neither the animation tick nor the drag path has to query the platform plugin.
+        if self._bounds_screen is None:
+            self._screen_geometry = None
+            self._screen_bounds = None
+            self._move_interval_ms = _DEFAULT_MOVE_INTERVAL_MS
+            return
+        geom = self._bounds_screen.availableGeometry()
+        self._screen_geometry = geom
+        self._screen_bounds = (geom.left(), geom.right())
+        rate = self._bounds_screen.refreshRate()
+        self._move_interval_ms = max(1, round(1000 / rate)) if rate > 0 else _DEFAULT_MOVE_INTERVAL_MS
 
     def _animate_step(self) -> None:
-        screen = QGuiApplication.primaryScreen()
-        if screen is None:
+        if self._screen_bounds is None:
             return
 
-        geom = screen.availableGeometry()
-        max_x = geom.right() - self.width()
-        min_x = geom.left()
+        min_x, screen_right = self._screen_bounds
+        max_x = screen_right - self.width()
 
-        new_x = self.x() + (self._direction * self._speed_px)
+        old_x = self.x()
+        new_x = old_x + (self._direction * self._speed_px)
         if new_x <= min_x:
             new_x = min_x
             self._direction = 1
-            self._apply_movie(self._movies[self._direction])
+            self._apply_animation(self._direction)
         elif new_x >= max_x:
             new_x = max_x
             self._direction = -1
-            self._apply_movie(self._movies[self._direction])
+            self._apply_animation(self._direction)
 
-        self.move(new_x, self.y())
+        if new_x != old_x:
+            self.move(new_x, self.y())
 
     def _toggle_pause(self) -> None:
         self._set_paused(not self._is_paused)
@@ -309,27 +527,39 @@ class DuckOverlayWindow(QWidget):
             self._apply_pixmap(self._front_pixmap)
             return
 
-        self._apply_movie(self._movies[self._direction])
+        self._apply_animation(self._direction)
         if not self._timer.isActive():
             self._timer.start()
 
     def _update_chatbox_position(self) -> None:
-        anchor = self._duck_label.rect().topRight()
-        anchor_global = self._duck_label.mapToGlobal(anchor)
-        label_size = self._chatbox_label.sizeHint()
-        target_x = int(anchor_global.x())
-        target_y = int(anchor_global.y() - label_size.height())
+        if self._chatbox_label.isVisible():
+            self._chatbox_sync_timer.start()
+
+    def _position_chatbox(self) -> None:
+        # The overlay is frameless, so its position is also the duck label's global origin.
+        target_x = self.x() + self._duck_label.x() + self._duck_label.width() - 1
+        target_y = self.y() + self._duck_label.y() - self._chatbox_label.height()
         self._chatbox_label.move(target_x, target_y)
 
     def _show_chatbox(self, *, auto_hide: bool = True) -> None:
-        self._update_chatbox_position()
-        self._chatbox_label.show()
-        self._chatbox_label.raise_()
+        # Defer to the next event-loop pass so the text resize and reposition land before the bubble is mapped.
+        self._chatbox_show_pending = True
+        self._chatbox_sync_timer.start()
         if auto_hide:
             self._chatbox_timer.start(3000)
         else:
             self._chatbox_timer.stop()
 
+    def _sync_chatbox(self) -> None:
+        self._position_chatbox()
+        if not self._chatbox_show_pending:
+            return
+        self._chatbox_show_pending = False
+        if self._chatbox_label.isVisible():
+            self._chatbox_label.raise_()
+        else:
+            self._chatbox_label.show()
+
     def _handle_exit(self) -> None:
         app = QGuiApplication.instance()
         if app is None:
@@ -344,39 +574,10 @@ class DuckOverlayWindow(QWidget):
         self._set_paused(False)
 
     def _request_duck_reply(self, action: str = "click") -> None:
-        if self._is_generating:
-            return
-        self._is_generating = True
-        preview = self._action_previews.get(action, self._action_previews["click"])
+        preview = self._ACTION_PREVIEWS.get(action, self._ACTION_PREVIEWS["click"])
         self._chatbox_label.setText(preview)
         self._show_chatbox(auto_hide=False)
-        self._start_worker(self._build_action_prompt(action))
-
-    def _build_action_prompt(self, action: str) -> str:
-        return self._action_prompts.get(action, self._action_prompts["click"])
-
-    def _start_worker(self, user_text: str) -> None:
-        worker = AgentWorker(self._agent, user_text)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        self._worker_threads[worker] = thread
-
-        thread.started.connect(worker.run)
-        worker.responded.connect(self._handle_agent_reply)
-        worker.errored.connect(self._handle_agent_error)
-        worker.finished.connect(self._handle_worker_finished)
-
-        thread.start()
-        self._threads.append(thread)
-
-    def _handle_worker_finished(self) -> None:
-        sender = self.sender()
-        if not isinstance(sender, AgentWorker):
-            return
-        thread = self._worker_threads.pop(sender, None)
-        if thread is None:
-            return
-        self._cleanup_worker(thread, sender)
+        self._channel.submit(self._ACTION_PROMPTS.get(action, self._ACTION_PROMPTS["click"]))
 
     def _handle_agent_reply(self, reply: str) -> None:
         message = reply.strip() or "Nova is momentarily speechless, try again!"
@@ -388,22 +589,5 @@ class DuckOverlayWindow(QWidget):
         self._chatbox_label.setText("My cosmic feathers got ruffled. Try again soon!")
         self._show_chatbox()
 
-    def _cleanup_worker(self, thread: QThread, worker: AgentWorker) -> None:
-        thread.quit()
-        thread.wait()
-        worker.deleteLater()
-        thread.deleteLater()
-        with contextlib.suppress(ValueError):
-            self._threads.remove(thread)
-        self._is_generating = False
-
-    def closeEvent(self, event) -> None:  # pragma: no cover - UI hook
-        for thread in self._threads:
-            thread.quit()
-            thread.wait(200)
-            thread.deleteLater()
-        self._threads.clear()
-        super().closeEvent(event)
-
 
 __all__ = ["DuckOverlayWindow"]
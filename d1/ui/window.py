@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import contextlib
 from html import escape
 from typing import Final
 
-from PySide6.QtCore import QEvent, Qt, QThread
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -19,7 +18,7 @@ from PySide6.QtWidgets import (
 )
 
 from ..agents import PetAgent
-from .worker import AgentWorker
+from .worker import AgentRequest, agent_loop
 
 
 class DesktopPetWindow(QWidget):
@@ -30,8 +29,8 @@ class DesktopPetWindow(QWidget):
     def __init__(self, agent: PetAgent | None = None) -> None:
         super().__init__()
         self._agent = agent or PetAgent()
-        self._threads: list[QThread] = []
-        self._worker_threads: dict[AgentWorker, QThread] = {}
+        self._pending: set[AgentRequest] = set()
+        self._streaming_reply = False
 
         self._build_ui()
 
@@ -92,37 +91,41 @@ class DesktopPetWindow(QWidget):
         self._append_message("Pixel", "Fresh start! Pixel shakes off the sleepies.")
 
     def _start_worker(self, user_text: str) -> None:
-        worker = AgentWorker(self._agent, user_text)
-        thread = QThread(self)
-        worker.moveToThread(thread)
-        self._worker_threads[worker] = thread
+        request = AgentRequest(self._agent, user_text)
+        self._pending.add(request)
 
-        thread.started.connect(worker.run)
-        worker.responded.connect(lambda reply: self._append_message("Pixel", reply))
-        worker.errored.connect(self._handle_worker_error)
-        worker.finished.connect(self._handle_worker_finished)
+        queued = Qt.ConnectionType.QueuedConnection
+        request.streamed.connect(self._append_reply_chunk, queued)
+        request.responded.connect(self._handle_reply, queued)
+        request.errored.connect(self._handle_worker_error, queued)
+        request.finished.connect(self._handle_worker_finished, queued)
 
-        thread.start()
-        self._threads.append(thread)
+        agent_loop().submit(request)
 
     def _handle_worker_finished(self) -> None:
         sender = self.sender()
-        if not isinstance(sender, AgentWorker):
-            return
-        thread = self._worker_threads.pop(sender, None)
-        if thread is None:
-            return
-        self._cleanup_worker(thread, sender)
-
-    def _cleanup_worker(self, thread: QThread, worker: AgentWorker) -> None:
-        thread.quit()
-        thread.wait()
-        worker.deleteLater()
-        thread.deleteLater()
-        with contextlib.suppress(ValueError):
-            self._threads.remove(thread)
+        if isinstance(sender, AgentRequest):
+            self._pending.discard(sender)
+            sender.deleteLater()
+        # Also reached after a stream fails midway, so the next reply starts a fresh line.
+        self._streaming_reply = False
         self._set_waiting(False)
 
+    def _append_reply_chunk(self, chunk: str) -> None:
+        if not self._streaming_reply:
+            chunk = chunk.lstrip()
+            if not chunk:
+                return
+            self.chat_view.append("<b>Pixel:</b> ")
+            self._streaming_reply = True
+        cursor = self.chat_view.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(chunk, QTextCharFormat())
+
+    def _handle_reply(self, reply: str) -> None:
+        if not self._streaming_reply:
+            self._append_message("Pixel", reply)
+
     def _handle_worker_error(self, details: str) -> None:
         self._append_message("Pixel", f"Something went wrong:\n{details}")
 
@@ -137,13 +140,5 @@ class DesktopPetWindow(QWidget):
         self.input_box.setDisabled(waiting)
         self.pet_label.setText("=^o^=" if waiting else "=^.^=")
 
-    def closeEvent(self, event: QEvent) -> None:  # pragma: no cover - UI hook
-        for thread in self._threads:
-            thread.quit()
-            thread.wait(200)
-            thread.deleteLater()
-        self._threads.clear()
-        super().closeEvent(event)
-
 
 __all__ = ["DesktopPetWindow"]
@@ -1,9 +1,16 @@
-"""Threaded worker for routing UI messages to the agent."""
+"""Background asyncio loop for routing UI messages to the agent."""
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import functools
+import threading
 import traceback
-from typing import final
+from collections.abc import Callable, Coroutine
+from typing import Any, final
 
 from PySide6.QtCore import QObject, Signal
 
@@ -11,10 +18,11 @@ from ..agents import PetAgent
 
 
 @final
-class AgentWorker(QObject):
-    """Runs the LangChain call on a background thread."""
+class AgentRequest(QObject):
+    """One agent turn; signals are queued back to the thread that created the request."""
 
     finished = Signal()
+    streamed = Signal(str)
     responded = Signal(str)
     errored = Signal(str)
 
@@ -23,14 +31,100 @@ class AgentWorker(QObject):
         self._agent = agent
         self._user_text = user_text
 
-    def run(self) -> None:
+    async def run(self) -> None:
         try:
-            reply = self._agent.respond(self._user_text)
-            self.responded.emit(reply)
+            self.responded.emit(await _collect_reply(self._agent, self._user_text, self.streamed.emit))
         except Exception:  # pragma: no cover - UI side effect
             self.errored.emit(traceback.format_exc())
         finally:
             self.finished.emit()
 
 
-__all__ = ["AgentWorker"]
+@final
+class AgentChannel(QObject):
+    """Long-lived request lane: one turn in flight, at most one waiting, extra submissions dropped."""
+
+    streamed = Signal(str)
+    responded = Signal(str)
+    errored = Signal(str)
+
+    def __init__(self, agent: PetAgent, *, loop: AgentLoop | None = None) -> None:
+        super().__init__()
+        self._agent = agent
+        self._loop = loop or agent_loop()
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1)
+        self._consumer = self._loop.spawn(self._consume())
+
+    def submit(self, user_text: str) -> None:
+        """Offer a prompt; it is silently dropped if one is already waiting."""
+        self._loop.call_soon(self._offer, user_text)
+
+    def close(self) -> None:
+        self._consumer.cancel()
+
+    def _offer(self, user_text: str) -> None:
+        with contextlib.suppress(asyncio.QueueFull):
+            self._queue.put_nowait(user_text)
+
+    async def _consume(self) -> None:
+        while True:
+            user_text = await self._queue.get()
+            try:
+                self.responded.emit(await _collect_reply(self._agent, user_text, self.streamed.emit))
+            except Exception:  # pragma: no cover - UI side effect
+                self.errored.emit(traceback.format_exc())
+
+
+@final
+class AgentLoop:
+    """Single daemon thread hosting an asyncio loop that multiplexes every agent turn."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="d1-agent-loop", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def submit(self, request: AgentRequest) -> None:
+        """Schedule request; connect its signals before calling this."""
+        self.spawn(request.run())
+
+    def spawn(self, coro: Coroutine[Any, Any, None]) -> concurrent.futures.Future[None]:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def call_soon(self, callback: Callable[[str], None], arg: str) -> None:
+        self._loop.call_soon_threadsafe(callback, arg)
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Cancel outstanding turns and stop the loop thread."""
+        if not self._loop.is_running():
+            return
+        with contextlib.suppress(concurrent.futures.TimeoutError):
+            self.spawn(_cancel_pending()).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+
+async def _cancel_pending() -> None:
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _collect_reply(agent: PetAgent, user_text: str, on_chunk: Callable[[str], Any]) -> str:
+    parts: list[str] = []
+    async for chunk in agent.astream_respond(user_text):
+        if chunk:
+            parts.append(chunk)
+            on_chunk(chunk)
+    return "".join(parts).strip()
+
+
+@functools.cache
+def agent_loop() -> AgentLoop:
+    """Return the process-wide loop, starting its thread on first use."""
+    return AgentLoop()
+
+
+__all__ = ["AgentChannel", "AgentLoop", "AgentRequest", "agent_loop"]
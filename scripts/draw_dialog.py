@@ -19,6 +19,7 @@ class BubbleWidget(QWidget):
         self.tail_height = 20  # 尾巴高度
         self.tail_width = 30  # 尾巴宽度
         self.tail_pos_offset = 40  # 尾巴距离左边的距离
+        self._cached_path = None  # 合并后的气泡路径，尺寸变化时重建
 
         # 3. 设置内部文字控件
         self.label = QLabel(text)
@@ -32,10 +33,18 @@ class BubbleWidget(QWidget):
         layout.setContentsMargins(20, 20, 20, 20 + self.tail_height)
         layout.addWidget(self.label)
 
+    def resizeEvent(self, event):
+        # 尺寸变化后旧路径失效
+        self._cached_path = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
         """
         重写绘图事件，绘制气泡背景
         """
+        if self._cached_path is None:
+            self._cached_path = self.build_path()
+
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)  # 开启抗锯齿，让线条平滑
 
@@ -46,7 +55,14 @@ class BubbleWidget(QWidget):
 
         painter.setBrush(QBrush(QColor("white")))
 
-        # --- B. 计算绘制区域 ---
+        # --- B. 绘制缓存的路径 ---
+        painter.drawPath(self._cached_path)
+
+    def build_path(self):
+        """
+        计算气泡轮廓（圆角矩形 + 尾巴）
+        """
+        # --- C. 计算绘制区域 ---
         # 需要考虑边框的一半宽度，防止线条被切掉
         rect_x = self.border_width / 2
         rect_y = self.border_width / 2
@@ -54,36 +70,37 @@ class BubbleWidget(QWidget):
         # 高度要减去尾巴的高度
         rect_h = self.height() - self.tail_height - self.border_width
 
-        # --- C. 创建路径 (QPainterPath) ---
-
-        # 1. 主体：圆角矩形
-        path_rect = QPainterPath()
-        rect_shape = QRectF(rect_x, rect_y, rect_w, rect_h)
-        path_rect.addRoundedRect(rect_shape, self.border_radius, self.border_radius)
-
-        # 2. 尾巴：三角形
-        path_tail = QPainterPath()
+        # --- D. 计算尾巴的三个点 ---
         tail_start_x = rect_x + self.tail_pos_offset
         tail_start_y = rect_y + rect_h
 
-        # 定义三角形的三个点
         p1 = QPointF(tail_start_x, tail_start_y)  # 基座左点
         p2 = QPointF(tail_start_x + self.tail_width, tail_start_y)  # 基座右点
         # 尾巴尖端 (指向左下)
         p3 = QPointF(tail_start_x - 10, tail_start_y + self.tail_height)
 
-        # 绘制三角形路径
-        path_tail.moveTo(p1)
-        path_tail.lineTo(p3)
-        path_tail.lineTo(p2)
-        path_tail.closeSubpath()  # 闭合路径
-
-        # --- D. 合并路径 (关键步骤) ---
-        # .united 会将两个形状融合，自动消除重叠部分的边框线
-        final_path = path_rect.united(path_tail)
-
-        # --- E. 绘制最终路径 ---
-        painter.drawPath(final_path)
+        # --- E. 沿外轮廓一笔画出整个气泡 ---
+        # 直接描出"圆角矩形 + 尾巴"的外轮廓，不再调用 .united 做布尔运算，
+        # 尾巴基座处没有线条，填充和描边一次 drawPath 即可完成
+        r = self.border_radius
+        d = r * 2
+        right = rect_x + rect_w
+        bottom = rect_y + rect_h
+
+        path = QPainterPath()
+        path.moveTo(p2)
+        path.lineTo(right - r, bottom)
+        path.arcTo(QRectF(right - d, bottom - d, d, d), 270, 90)  # 右下角
+        path.lineTo(right, rect_y + r)
+        path.arcTo(QRectF(right - d, rect_y, d, d), 0, 90)  # 右上角
+        path.lineTo(rect_x + r, rect_y)
+        path.arcTo(QRectF(rect_x, rect_y, d, d), 90, 90)  # 左上角
+        path.lineTo(rect_x, bottom - r)
+        path.arcTo(QRectF(rect_x, bottom - d, d, d), 180, 90)  # 左下角
+        path.lineTo(p1)
+        path.lineTo(p3)
+        path.closeSubpath()  # 回到 p2，闭合路径
+        return path
 
 
 # --- 测试主程序 ---
@@ -3,23 +3,43 @@
 from __future__ import annotations
 
 import argparse
-import json
+import asyncio
+import contextlib
+import functools
+import hashlib
 import os
+import random
 import sys
-from dataclasses import dataclass
-from typing import Any, Final
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Final, Self
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 DEFAULT_ENDPOINT: Final[str] = "/v1/chat/completions"
+POOL_LIMITS: Final[httpx.Limits] = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+MEMO_SIZE: Final[int] = 1024
+RETRY_ATTEMPTS: Final[int] = 3
+RETRY_INITIAL_DELAY: Final[float] = 0.2
+RETRY_MAX_DELAY: Final[float] = 2.0
+# Only failures before the request left the client; a timed-out POST may already be generating (and billing).
+_RETRYABLE_ERRORS: Final = (httpx.ConnectError, httpx.ConnectTimeout)
+_PROMPT_SENTINEL: Final[str] = "__PROMPT__"
+DEFAULT_CACHE_DIR: Final[Path] = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "d1-grok"
 
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Send a test chat completion request to a Grok API endpoint.",
     )
-    parser.add_argument("prompt", help="User message to send to Grok.")
+    parser.add_argument("prompt", nargs="+", help="User message(s) to send to Grok; several are sent concurrently.")
     parser.add_argument(
         "--model",
         default="grok-4-fast",
@@ -53,6 +73,32 @@ def _build_parser() -> argparse.ArgumentParser:
         default=30.0,
         help="HTTP client timeout in seconds.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum in-flight requests when several prompts are given (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always hit the API; temperature 0 responses are otherwise cached under {DEFAULT_CACHE_DIR}.",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=86400.0,
+        help="Seconds a cached response stays valid (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--stream",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Print the reply as it is generated, bypassing the response cache (default: on for a single "
+            "prompt to a terminal unless the reply is cacheable, i.e. --temperature 0 without --no-cache)."
+        ),
+    )
     parser.add_argument(
         "--raw",
         action="store_true",
@@ -61,6 +107,10 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+# Built once per interpreter; main() may be called repeatedly (e.g. from tests) with different argv.
+_PARSER: Final[argparse.ArgumentParser] = _build_parser()
+
+
 @dataclass(slots=True, frozen=True)
 class GrokRequest:
     """Parameters for the Grok chat call."""
@@ -73,35 +123,298 @@ class GrokRequest:
     temperature: float
 
 
+def _status_error(response: httpx.Response) -> httpx.HTTPStatusError:
+    # Built only on failure; the success path is a bare status comparison rather than raise_for_status().
+    return httpx.HTTPStatusError(
+        f"HTTP {response.status_code} for url {response.url}", request=response.request, response=response
+    )
+
+
+def _is_transient(response: httpx.Response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _backoff(attempt: int) -> float:
+    """Full-jitter delay before retry ``attempt`` (1-based): uniform up to the capped exponential step."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_INITIAL_DELAY * 2 ** (attempt - 1)))
+
+
+@functools.lru_cache(maxsize=32)
+def _payload_template(
+    model: str, system_prompt: str, max_tokens: int, temperature: float, stream: bool
+) -> tuple[bytes, bytes]:
+    """Encode everything but the user prompt once; requests splice the encoded prompt between the halves."""
+    payload: dict[str, Any] = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": _PROMPT_SENTINEL},
+        ],
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+    }
+    if stream:
+        payload["stream"] = True
+    # The user message is the last string in the payload, so the final sentinel match is always its slot.
+    head, _, tail = orjson.dumps(payload).rpartition(orjson.dumps(_PROMPT_SENTINEL))
+    return head, tail
+
+
+@dataclass(slots=True)
+class GrokCache:
+    """Content-addressed response store: one JSON file per request hash, expired by modification time."""
+
+    directory: Path = DEFAULT_CACHE_DIR
+    ttl: float | None = None
+
+    def get(self, key: str) -> bytes | None:
+        path = self.directory / f"{key}.json"
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def set(self, key: str, content: bytes) -> None:
+        """Store the raw response body; written via a temp file so readers never see a partial entry."""
+        with contextlib.suppress(OSError):
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(content)
+                os.replace(tmp_path, self.directory / f"{key}.json")
+            except OSError:
+                # Don't leave an orphaned temp file behind in the cache directory.
+                os.unlink(tmp_path)
+                raise
+
+
 @dataclass(slots=True)
 class GrokClient:
-    """Tiny HTTP wrapper around the Grok REST API."""
+    """Tiny HTTP wrapper around the Grok REST API that keeps one pooled connection across calls."""
 
     base_url: str
     token: str
     timeout: float
+    cache: GrokCache | None = None
+    memoize: bool = True
+    _memo: OrderedDict[GrokRequest, bytes] = field(default_factory=OrderedDict, init=False, repr=False)
+    _headers: dict[str, str] = field(init=False, repr=False)
+    _client: httpx.Client | None = field(default=None, init=False, repr=False)
+    _aclient: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Installed as the pooled clients' defaults, so requests never rebuild them.
+        self._headers = {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def close(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP client, if one was opened."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    def _get_client(self) -> httpx.Client:
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.base_url.rstrip("/"),
+                headers=self._headers,
+                timeout=self.timeout,
+                limits=POOL_LIMITS,
+                http2=True,
+            )
+        return self._client
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        if self._aclient is None:
+            self._aclient = httpx.AsyncClient(
+                base_url=self.base_url.rstrip("/"),
+                headers=self._headers,
+                timeout=self.timeout,
+                limits=POOL_LIMITS,
+                http2=True,
+            )
+        return self._aclient
+
+    def _prepare(self, request: GrokRequest, *, stream: bool = False) -> tuple[str, bytes]:
+        # Relative to the pooled client's base_url, which httpx joins for us.
+        url = request.endpoint
+        head, tail = _payload_template(
+            request.model, request.system_prompt, request.max_tokens, request.temperature, stream
+        )
+        return url, head + orjson.dumps(request.prompt) + tail
+
+    def _recall(self, request: GrokRequest) -> bytes | None:
+        if not self.memoize or request.temperature != 0.0:
+            return None
+        content = self._memo.get(request)
+        if content is not None:
+            self._memo.move_to_end(request)
+        return content
+
+    def _remember(self, request: GrokRequest, content: bytes) -> bytes:
+        if self.memoize and request.temperature == 0.0:
+            self._memo[request] = content
+            if len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return content
+
+    def _cache_key(self, request: GrokRequest, url: str, body: bytes) -> str | None:
+        # Sampled replies differ run to run, so only deterministic calls are worth replaying.
+        if self.cache is None or request.temperature != 0.0:
+            return None
+        return hashlib.sha256(f"{self.base_url}\0{url}\0".encode() + body).hexdigest()
+
+    def _post(self, url: str, body: bytes) -> httpx.Response:
+        # Retries go back through the pooled client, so they reuse its warm connection.
+        client = self._get_client()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = client.post(url, content=body)
+            except _RETRYABLE_ERRORS:
+                if attempt >= RETRY_ATTEMPTS:
+                    raise
+            else:
+                if response.status_code < 400:
+                    return response
+                if attempt >= RETRY_ATTEMPTS or not _is_transient(response):
+                    raise _status_error(response)
+            time.sleep(_backoff(attempt))
+
+    async def _apost(self, url: str, body: bytes) -> httpx.Response:
+        client = self._get_aclient()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await client.post(url, content=body)
+            except _RETRYABLE_ERRORS:
+                if attempt >= RETRY_ATTEMPTS:
+                    raise
+            else:
+                if response.status_code < 400:
+                    return response
+                if attempt >= RETRY_ATTEMPTS or not _is_transient(response):
+                    raise _status_error(response)
+            await asyncio.sleep(_backoff(attempt))
+
+    def fetch(self, request: GrokRequest) -> bytes:
+        """Send a chat completion request and return the undecoded response body.
+
+        Deterministic (temperature 0) bodies are memoised per client and, with a cache configured, kept on disk.
+        """
+        if (memo := self._recall(request)) is not None:
+            return memo
+        url, body = self._prepare(request)
+        key = self._cache_key(request, url, body)
+        if key is not None and (cached := self.cache.get(key)) is not None:
+            return self._remember(request, cached)
+        response = self._post(url, body)
+        if key is not None:
+            self.cache.set(key, response.content)
+        return self._remember(request, response.content)
 
     def chat(self, request: GrokRequest) -> dict[str, Any]:
         """Send a chat completion request."""
-        url = f"{self.base_url.rstrip('/')}{request.endpoint}"
-        payload: dict[str, Any] = {
-            "model": request.model,
-            "messages": [
-                {"role": "system", "content": request.system_prompt},
-                {"role": "user", "content": request.prompt},
-            ],
-            "max_tokens": request.max_tokens,
-            "temperature": request.temperature,
-        }
-        headers = {"Authorization": f"Bearer {self.token}"}
-
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        return orjson.loads(self.fetch(request))
+
+    def chat_stream(self, request: GrokRequest) -> Iterator[str]:
+        """Yield reply text deltas as server-sent events arrive; bypasses the response caches."""
+        url, body = self._prepare(request, stream=True)
+        with self._get_client().stream("POST", url, content=body) as response:
+            if response.status_code >= 400:
+                response.read()
+                raise _status_error(response)
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                for choice in orjson.loads(data).get("choices") or ():
+                    if content := (choice.get("delta") or {}).get("content"):
+                        yield content
+
+    async def afetch(self, request: GrokRequest) -> bytes:
+        """Async counterpart of ``fetch``, sharing its memo and disk cache."""
+        if (memo := self._recall(request)) is not None:
+            return memo
+        url, body = self._prepare(request)
+        key = self._cache_key(request, url, body)
+        if key is not None and (cached := self.cache.get(key)) is not None:
+            return self._remember(request, cached)
+        response = await self._apost(url, body)
+        if key is not None:
+            self.cache.set(key, response.content)
+        return self._remember(request, response.content)
+
+    async def achat(self, request: GrokRequest) -> dict[str, Any]:
+        """Send a chat completion request without blocking the event loop."""
+        return orjson.loads(await self.afetch(request))
+
+    async def afetch_many(self, requests: Sequence[GrokRequest], *, concurrency: int | None = None) -> list[bytes]:
+        """Fetch bodies concurrently, at most ``concurrency`` at a time, returning them in request order."""
+        gate = asyncio.Semaphore(concurrency) if concurrency is not None else None
+        in_flight: dict[GrokRequest, asyncio.Future[bytes]] = {}
+
+        async def limited(request: GrokRequest) -> bytes:
+            if gate is None:
+                return await self.afetch(request)
+            async with gate:
+                return await self.afetch(request)
 
+        def schedule(request: GrokRequest) -> asyncio.Future[bytes]:
+            # Duplicate deterministic requests share one in-flight call rather than racing the memo.
+            if not self.memoize or request.temperature != 0.0:
+                return asyncio.ensure_future(limited(request))
+            if request not in in_flight:
+                in_flight[request] = asyncio.ensure_future(limited(request))
+            return in_flight[request]
 
+        return await asyncio.gather(*(schedule(request) for request in requests))
+
+    async def achat_many(
+        self, requests: Sequence[GrokRequest], *, concurrency: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Send requests concurrently, at most ``concurrency`` at a time, returning responses in order."""
+        return [orjson.loads(content) for content in await self.afetch_many(requests, concurrency=concurrency)]
+
+
+@functools.cache
 def _load_env_credentials() -> tuple[str, str]:
+    """Read credentials once per process; call ``_load_env_credentials.cache_clear()`` to force a reload."""
     load_dotenv()
     base_url = os.getenv("GROK_BASE_URL")
     token = os.getenv("GROK_AUTH_TOKEN")
@@ -115,13 +428,22 @@ def _load_env_credentials() -> tuple[str, str]:
 def _render_response(data: dict[str, Any]) -> str:
     """Return either the assistant content or a JSON dump fallback."""
     try:
-        return data["choices"][0]["message"]["content"]
+        content = data["choices"][0]["message"]["content"]
     except (KeyError, IndexError, TypeError):
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        content = None
+    # Tool-call and refusal replies carry a null content; show the whole response instead.
+    if isinstance(content, str):
+        return content
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+async def _fetch_concurrently(client: GrokClient, requests: Sequence[GrokRequest], concurrency: int) -> list[bytes]:
+    async with client:
+        return await client.afetch_many(requests, concurrency=concurrency)
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
+    parser = _PARSER
     args = parser.parse_args(argv)
 
     try:
@@ -129,28 +451,59 @@ def main(argv: list[str] | None = None) -> int:
     except RuntimeError as exc:
         parser.error(str(exc))
 
-    request = GrokRequest(
-        model=args.model,
-        prompt=args.prompt,
-        system_prompt=args.system,
-        endpoint=args.endpoint,
-        max_tokens=args.max_tokens,
-        temperature=args.temperature,
-    )
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1.")
+    if args.stream and (args.raw or len(args.prompt) > 1):
+        parser.error("--stream takes a single prompt and cannot be combined with --raw.")
+    if args.stream is None:
+        # Interactive runs show the first tokens as soon as they arrive; pipes keep the buffered output,
+        # and cacheable replies go through fetch() so the memo and disk cache still serve repeats.
+        cacheable = args.temperature == 0.0 and not args.no_cache
+        args.stream = not args.raw and not cacheable and len(args.prompt) == 1 and sys.stdout.isatty()
+
+    requests = [
+        GrokRequest(
+            model=args.model,
+            prompt=prompt,
+            system_prompt=args.system,
+            endpoint=args.endpoint,
+            max_tokens=args.max_tokens,
+            temperature=args.temperature,
+        )
+        for prompt in args.prompt
+    ]
 
-    client = GrokClient(base_url=base_url, token=token, timeout=args.timeout)
+    cache = None if args.no_cache else GrokCache(ttl=args.cache_ttl)
+    client = GrokClient(base_url=base_url, token=token, timeout=args.timeout, cache=cache, memoize=not args.no_cache)
     try:
-        response_json = client.chat(request)
+        if args.stream:
+            with client:
+                for delta in client.chat_stream(requests[0]):
+                    sys.stdout.write(delta)
+                    sys.stdout.flush()
+            sys.stdout.write("\n")
+            return 0
+        if len(requests) == 1:
+            with client:
+                bodies = [client.fetch(requests[0])]
+        else:
+            bodies = asyncio.run(_fetch_concurrently(client, requests, args.concurrency))
     except httpx.HTTPStatusError as exc:
         body = exc.response.text
         parser.error(f"Request failed ({exc.response.status_code}): {body}")
     except httpx.HTTPError as exc:
         parser.error(f"HTTP error: {exc}")  # pragma: no cover - network side effect
 
-    if args.raw:
-        print(json.dumps(response_json, indent=2, ensure_ascii=False))
-    else:
-        print(_render_response(response_json))
+    chunks: list[bytes] = []
+    for body in bodies:
+        if args.raw:
+            # Passed through untouched: no decode/encode round trip for the full dump.
+            chunks.append(body if body.endswith(b"\n") else body + b"\n")
+        else:
+            chunks.append(_render_response(orjson.loads(body)).encode() + b"\n")
+    # One write on the binary buffer skips the text layer's encoding and line-buffered flushes.
+    sys.stdout.buffer.write(b"".join(chunks))
+    sys.stdout.flush()
     return 0
 
 
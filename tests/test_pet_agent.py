@@ -0,0 +1,37 @@
+"""PetAgent history wiring against the offline LocalPetChatModel."""
+
+from __future__ import annotations
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from d1.agents import PetAgent
+from d1.models import LocalPetChatModel
+
+
+def _agent(**kwargs: object) -> PetAgent:
+    return PetAgent(llm=LocalPetChatModel(), **kwargs)
+
+
+def test_history_step_reads_messages_at_invoke_time() -> None:
+    agent = _agent()
+    assert agent._history_step.invoke({}) == []
+
+    message = HumanMessage(content="added after construction")
+    agent._chat_history.add_messages([message])
+
+    assert agent._history_step.invoke({}) == [message]
+
+
+def test_window_rollover_folds_dropped_turns_into_summary() -> None:
+    agent = _agent(window_reset_threshold=8)
+    for turn in range(1, 7):
+        agent.respond(f"turn {turn}")
+
+    sent = agent._history_step.invoke({})
+
+    # Nothing stored is hidden from the model, and the oldest turns survive only as summary bullets.
+    assert sent == agent._chat_history.messages
+    assert len(sent) < 2 * 6
+    assert isinstance(sent[0], SystemMessage)
+    assert "User: turn 1" in sent[0].text
+    assert sent[-2].text == "turn 6"